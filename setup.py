@@ -26,6 +26,7 @@ setup(
         "Translate": ["googletrans>=3.1.0a0"],
         "Regulation": ["aes"],
         "Sound": ["pydub"],
+        "FastCompression": ["isal"],
     },
     author="Scott Mooney (Grimrukh)",
     author_email="grimrukh@gmail.com",
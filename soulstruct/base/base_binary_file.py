@@ -82,7 +82,8 @@ class BaseBinaryFile:
     def from_path(cls, path: str | Path) -> Self:
         path = Path(path)
         try:
-            binary_file = cls.from_bytes(BinaryReader(path))
+            # Read the whole file up front, so the reader can unpack directly from the file data.
+            binary_file = cls.from_bytes(path.read_bytes())
         except Exception:
             _LOGGER.error(f"Error occurred while reading `{cls.__name__}` with path '{path}'. See traceback.")
             raise
@@ -453,7 +453,6 @@ class EVSParser(abc.ABC):
         """Shortcut for RunEvent(...) instruction."""
         name, args, kwargs = self._parse_function_call(node)
         event_info = self.common_func_evs.events[name] if is_common_func else self.events[name]
-        kwargs = self._parse_keyword_nodes(node.keywords)
         event_layer_string = format_event_layers(kwargs.pop("event_layers", None))
 
         if not args and not kwargs and not event_info.args:
@@ -127,6 +127,12 @@ class GameEnumsManager(abc.ABC):
         # overlaps. (Fatal overlaps will raise an exception immediately.)
         self.all_enum_values = {}
 
+        # Reverse lookups built from `enums` on first check-out and reset whenever a module is (re)loaded. Map enum
+        # values and game types to the names of the modules that contain them, so `check_out_enum()` does not have to
+        # scan every module for every value.
+        self._value_module_names = None  # type: dict[int, list[str]] | None
+        self._game_type_module_names = None  # type: dict[GAME_INT_TYPE, set[str]] | None
+
         # Default. Can be set by user.
         self.used_enums = []
         self.star_module_names = []
@@ -234,23 +240,37 @@ class GameEnumsManager(abc.ABC):
         `VALID_GAME_TYPES`).
         """
         self.enums[module_name] = {}  # reset
+        self._value_module_names = None
+        self._game_type_module_names = None
         for game_enum_name, game_enum_class in self._get_module_members(module_name, module):
             game_enum_class: GAME_INT_TYPE | tp.Iterable
 
-            match_found = False
+            # We check each registered game type, as some may be hierarchical. This only depends on the class, so we
+            # resolve the matching types once rather than once per member.
+            game_enum_mro = set(game_enum_class.__mro__)
+            game_types = [game_type for game_type in self.VALID_GAME_TYPES if game_type in game_enum_mro]
             for enum_member in game_enum_class:
-                # We check each registered game type, as some may be hierarchical.
-                for game_type in self.VALID_GAME_TYPES:
-                    if game_type in game_enum_class.__mro__:
-                        match_found = True
-                        self._parse_game_type_enum(module_name, game_type, enum_member)
+                for game_type in game_types:
+                    self._parse_game_type_enum(module_name, game_type, enum_member)
 
-            if not match_found:
+            if not game_types:
                 _LOGGER.warning(
                     f"Ignoring game enum type `{game_enum_name}` in module '{module.__file__}`, as its type does not "
                     f"match any of the `VALID_GAME_TYPES` specified for this `GameEnumsManager`."
                 )
 
+    def _build_module_name_lookups(self):
+        """Build reverse lookups from enum values and game types to the names of the modules that contain them."""
+        self._value_module_names = {}
+        self._game_type_module_names = {}
+        for module_name, module_enums in self.enums.items():
+            for game_type, enum_dict in module_enums.items():
+                self._game_type_module_names.setdefault(game_type, set()).add(module_name)
+                for enum_value in enum_dict:
+                    module_names = self._value_module_names.setdefault(enum_value, [])
+                    if not module_names or module_names[-1] != module_name:
+                        module_names.append(module_name)
+
     def check_out_enum(
         self,
         enum_value: int,
@@ -320,22 +340,21 @@ class GameEnumsManager(abc.ABC):
                 self.used_enums.append(star_hits[0])
             return star_hits[0]
 
-        # Try other modules.
+        if self._value_module_names is None:
+            self._build_module_name_lookups()
+
+        # Try other modules. Only modules that contain `enum_value` under some game type can produce a hit.
         non_star_hits = []
-        for module_name in self.enums:
+        for module_name in self._value_module_names.get(enum_value, ()):
             if module_name in star_module_names:
                 continue  # already checked above
             module_enums = self.enums[module_name]
             for game_type in game_types:
-                if game_type not in module_enums:
-                    continue
-                type_found = True
-                # Type has been found. Look for matching value within.
                 try:
                     enum_info = module_enums[game_type][enum_value]
                     non_star_hits.append(enum_info)
                 except KeyError:
-                    continue  # value not found; try other `game_types`
+                    continue  # type or value not found; try other `game_types`
 
         if len(non_star_hits) > 1:
             # TODO: Severity of this probably mostly depends on whether any restricted `game_types` were given. If not,
@@ -349,6 +368,14 @@ class GameEnumsManager(abc.ABC):
                 self.used_enums.append(non_star_hits[0])
             return non_star_hits[0]
 
+        if not type_found:
+            # Check if any of the game types are present in a non-star module at all.
+            type_found = any(
+                module_name not in star_module_names
+                for game_type in game_types
+                for module_name in self._game_type_module_names.get(game_type, ())
+            )
+
         if not type_found:
             # NOTE: Only possible if some `game_types` were given, as otherwise they will be the same by definition.
             raise self.MissingEnumTypeError(
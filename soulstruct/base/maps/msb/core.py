@@ -93,6 +93,10 @@ class MSB(GameFile, abc.ABC):
     ENTITY_GAME_TYPES: tp.ClassVar[dict[str, type[MapEntity]]]
     # Cached when first accessed. Maps subtype list names, e.g. 'map_pieces', to the list. Immutable.
     _SUBTYPE_LIST_NAMES: tp.ClassVar[tuple[str, ...]] = None
+    # Cached when first accessed. Maps supertypes to `{subtype_int: subtype_info}` dictionaries for unpacking.
+    _SUBTYPE_INFO_BY_INT: tp.ClassVar[dict[MSBSupertype, dict[int, MSBSubtypeInfo]]] = None
+    # Cached as names are resolved. Maps `(subtype_name, assert_supertype_name)` arguments to subtype list names.
+    _RESOLVED_SUBTYPE_NAMES: tp.ClassVar[dict[tuple[str, str | None], str]] = None
 
     # Per-type callables that map a `map_base_id` entity ID to a dictionary of `first_value` and `last_value` kwargs.
     ID_RANGES = {}  # type: dict[GAME_INT_TYPE, tp.Callable[[int], dict[str, int]]]
@@ -156,13 +160,12 @@ class MSB(GameFile, abc.ABC):
     @classmethod
     def _unpack_entry(cls, reader: BinaryReader, supertype: MSBSupertype, entry_lists: dict[str, list[MSBEntry]]):
         subtype_int = reader["i", reader.position + cls.MSB_ENTRY_SUBTYPE_OFFSETS[supertype]]
-        for _, subtype_info in cls.MSB_ENTRY_SUBTYPES[supertype].items():
-            if subtype_info.subtype_enum.value == subtype_int:
-                subtype_class = subtype_info.entry_class
-                subtype_list_name = subtype_info.subtype_list_name
-                break
-        else:
+        try:
+            subtype_info = cls._get_subtype_info_by_int()[supertype][subtype_int]
+        except KeyError:
             raise TypeError(f"Unknown '{supertype}' subtype enum value: {subtype_int}")
+        subtype_class = subtype_info.entry_class
+        subtype_list_name = subtype_info.subtype_list_name
         try:
             entry = subtype_class.from_msb_reader(reader)
         except Exception as ex:
@@ -174,6 +177,18 @@ class MSB(GameFile, abc.ABC):
             entry_lists[subtype_list_name] = MSBEntryList(supertype=supertype, subtype_info=subtype_info)
         entry_lists[subtype_list_name].append(entry)
 
+    @classmethod
+    def _get_subtype_info_by_int(cls) -> dict[MSBSupertype, dict[int, MSBSubtypeInfo]]:
+        if cls._SUBTYPE_INFO_BY_INT is not None:
+            return cls._SUBTYPE_INFO_BY_INT
+        subtype_info_by_int = {}
+        for supertype, subtype_infos in cls.MSB_ENTRY_SUBTYPES.items():
+            supertype_infos = subtype_info_by_int[supertype] = {}
+            for subtype_info in subtype_infos.values():
+                supertype_infos.setdefault(subtype_info.subtype_enum.value, subtype_info)  # first match wins
+        cls._SUBTYPE_INFO_BY_INT = subtype_info_by_int
+        return subtype_info_by_int
+
     @classmethod
     def resolve_supertype_name(cls, supertype_name: str) -> MSBSupertype:
         return cls.MSB_SUPERTYPE_ENUM.resolve(supertype_name)
@@ -242,6 +257,10 @@ class MSB(GameFile, abc.ABC):
         if self.HAS_HEADER:
             writer.append(MSB_HEADER_BYTES)
 
+        # Maps subtype list names to `{id(entry): subtype_index}` dictionaries, so that each entry's subtype index does
+        # not need a linear search of its subtype list. Built per subtype list on first use.
+        subtype_indices = {}  # type: dict[str, dict[int, int]]
+
         for supertype_name in self.MSB_ENTRY_SUPERTYPES:
             supertype_list = entry_lists[supertype_name]
             self.SUPERTYPE_LIST_HEADER.object_to_writer(
@@ -261,7 +280,11 @@ class MSB(GameFile, abc.ABC):
                 entry: MSBEntry
                 writer.fill_with_position("entry_offset", obj=entry)
                 subtype_name = self.MSB_ENTRY_SUBTYPES[supertype_name][entry.SUBTYPE_ENUM.name].subtype_list_name
-                subtype_index = entry_lists[subtype_name].index(entry)
+                if subtype_name not in subtype_indices:
+                    subtype_list_indices = subtype_indices[subtype_name] = {}
+                    for i, subtype_entry in enumerate(entry_lists[subtype_name]):
+                        subtype_list_indices.setdefault(id(subtype_entry), i)  # first index, as in `IDList.index()`
+                subtype_index = subtype_indices[subtype_name].get(id(entry), -1)
                 if supertype_name == self.MSB_SUPERTYPE_ENUM.MODELS:
                     entry: BaseMSBModel
                     instance_count = model_instance_counts.get(entry.name, 0)
@@ -582,11 +605,18 @@ class MSB(GameFile, abc.ABC):
     @classmethod
     def resolve_subtype_name(cls, subtype_name: str, assert_supertype_name: str = None) -> str:
         """Parse `subtype_name` (which could be an enum name or class name) to its subtype list name."""
+        if cls._RESOLVED_SUBTYPE_NAMES is None:
+            cls._RESOLVED_SUBTYPE_NAMES = {}
+        try:
+            return cls._RESOLVED_SUBTYPE_NAMES[subtype_name, assert_supertype_name]
+        except KeyError:
+            pass
         for supertype_name, subtype_info_list in cls.MSB_ENTRY_SUBTYPES.items():
             if assert_supertype_name is not None and supertype_name != assert_supertype_name:
                 continue
             for info in subtype_info_list.values():
                 if info.matches_name(subtype_name):
+                    cls._RESOLVED_SUBTYPE_NAMES[subtype_name, assert_supertype_name] = info.subtype_list_name
                     return info.subtype_list_name
         raise KeyError(f"Invalid MSB subtype name: {subtype_name}")
 
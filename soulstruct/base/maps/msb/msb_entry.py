@@ -30,6 +30,9 @@ if tp.TYPE_CHECKING:
 
 _LOGGER = logging.getLogger("soulstruct")
 
+# Splits an entry field type string into its element type name and optional list length, e.g. "MSBPart[32]".
+_FIELD_TYPE_RE = re.compile(r"([\w |]+)(\[\d+])?")
+
 
 # Maps valid `MSBEntry` field type annotation strings to their actual types.
 # Note that other types may be acceptable, e.g. `int` can be converted to `float`.
@@ -450,139 +453,138 @@ class MSBEntry(abc.ABC):
             super(MSBEntry, self).__setattr__(key, value)
             return
 
-        for field_name, field_type in field_types.items():
-            if key == field_name:
+        if key not in field_types:
+            raise ValueError(f"Invalid `MSBEntry` subclass field: `{self.cls_name}.{key}`")
+        field_name, field_type = key, field_types[key]
 
-                if isinstance(value, property):
-                    # No inspection.
-                    super(MSBEntry, self).__setattr__(field_name, value)
-                    return
+        if isinstance(value, property):
+            # No inspection.
+            super(MSBEntry, self).__setattr__(field_name, value)
+            return
 
-                if (
-                    field_name.startswith("_")
-                    and (field_name.endswith("_index") or field_name.endswith("_indices"))
-                    and value is None
-                ):
-                    # `None` can be assigned to internal index fields.
-                    super(MSBEntry, self).__setattr__(field_name, value)
-                    return
+        if (
+            field_name.startswith("_")
+            and (field_name.endswith("_index") or field_name.endswith("_indices"))
+            and value is None
+        ):
+            # `None` can be assigned to internal index fields.
+            super(MSBEntry, self).__setattr__(field_name, value)
+            return
 
-                entry_type_name, length_str = re.match(r"([\w |]+)(\[\d+])?", field_type).groups()
+        entry_type_name, length_str = _FIELD_TYPE_RE.match(field_type).groups()
 
-                if length_str is not None:
-                    # List of entry subclasses or integers.
-                    length = int(length_str[1:-1])  # remove brackets
-                    if not isinstance(value, (list, tuple)):
+        if length_str is not None:
+            # List of entry subclasses or integers.
+            length = int(length_str[1:-1])  # remove brackets
+            if not isinstance(value, (list, tuple)):
+                raise TypeError(
+                    f"Must assign a list/tuple to list field `{self.cls_name}.{field_name}`."
+                )
+            if entry_type_name == "int":
+                if len(value) != length:
+                    raise ValueError(
+                        f"Int list field `{self.cls_name}.{field_name}` must have exactly {length} elements."
+                    )
+                for element in value:
+                    if not isinstance(element, int):
                         raise TypeError(
-                            f"Must assign a list/tuple to list field `{self.cls_name}.{field_name}`."
+                            f"Int list field `{self.cls_name}.{field_name}` contains non-int: {value}"
                         )
-                    if entry_type_name == "int":
-                        if len(value) != length:
-                            raise ValueError(
-                                f"Int list field `{self.cls_name}.{field_name}` must have exactly {length} elements."
-                            )
-                        for element in value:
-                            if not isinstance(element, int):
-                                raise TypeError(
-                                    f"Int list field `{self.cls_name}.{field_name}` contains non-int: {value}"
-                                )
-                        list_value = list(value)
-                    elif entry_type_name == "float":
-                        if len(value) != length:
-                            raise ValueError(
-                                f"Float list field `{self.cls_name}.{field_name}` must have exactly {length} elements."
-                            )
-                        floats = []
-                        for element in value:
-                            if isinstance(element, int):
-                                element = float(element)
-                            elif not isinstance(element, float):
-                                raise TypeError(
-                                    f"Float list field `{self.cls_name}.{field_name}` contains non-number: {value}"
-                                )
-                            floats.append(element)
-                        list_value = floats
-                    elif entry_type_name.startswith("MSB"):  # MSBEntry
-                        if len(value) > length:
-                            raise ValueError(
-                                f"Maximum size of entry list field `{self.cls_name}.{field_name}` is {length}."
-                            )
-                        list_value = []
-                        for element in value:
-                            if element is None:
-                                list_value.append(None)
-                            elif self._is_subtype(element, entry_type_name):
-                                list_value.append(element)
-                            else:
-                                raise TypeError(
-                                    f"Invalid type for entry list field `{self.cls_name}.{field_name}`: "
-                                    f"{element.__class__.__name__}"
-                                )
-                        while len(list_value) < length:
-                            list_value.append(None)
+                list_value = list(value)
+            elif entry_type_name == "float":
+                if len(value) != length:
+                    raise ValueError(
+                        f"Float list field `{self.cls_name}.{field_name}` must have exactly {length} elements."
+                    )
+                floats = []
+                for element in value:
+                    if isinstance(element, int):
+                        element = float(element)
+                    elif not isinstance(element, float):
+                        raise TypeError(
+                            f"Float list field `{self.cls_name}.{field_name}` contains non-number: {value}"
+                        )
+                    floats.append(element)
+                list_value = floats
+            elif entry_type_name.startswith("MSB"):  # MSBEntry
+                if len(value) > length:
+                    raise ValueError(
+                        f"Maximum size of entry list field `{self.cls_name}.{field_name}` is {length}."
+                    )
+                list_value = []
+                for element in value:
+                    if element is None:
+                        list_value.append(None)
+                    elif self._is_subtype(element, entry_type_name):
+                        list_value.append(element)
                     else:
-                        raise TypeError(f"Invalid field type for `{self.cls_name}.{field_name}`: {field_type}")
-                    super(MSBEntry, self).__setattr__(field_name, list_value)
-                    return
-
-                if entry_type_name.startswith("MSB"):
-                    # Single entry (or None).
-                    if value is not None and not self._is_subtype(value, entry_type_name):
-                        if not self._is_permitted_wrong_msb_entry_type(value):
-                            raise TypeError(
-                                f"Invalid type for entry field `{self.cls_name}.{field_name}` of '{self.name}': "
-                                f"{value.__class__.__name__} ({value})"
-                            )
-                    super(MSBEntry, self).__setattr__(field_name, value)
-                    return
-
-                if field_type in {"GroupBitSet128", "GroupBitSet256", "GroupBitSet1024"}:
-                    # `GroupBitSet` subclass of some maximum count.
-                    if not isinstance(value, (GroupBitSet128, GroupBitSet256, GroupBitSet1024)):
-                        # Lists will be interpreted as packed uints, and sets as enabled bits.
-                        if field_type.endswith("128"):
-                            value = GroupBitSet128(value)
-                        elif field_type.endswith("256"):
-                            value = GroupBitSet256(value)
-                        else:  # field_type.endswith("1024"):
-                            value = GroupBitSet1024(value)
-                    super(MSBEntry, self).__setattr__(field_name, value)
-                    return
-
-                # Type is exactly correct.
-                if type(value).__name__ == field_type:
-                    super(MSBEntry, self).__setattr__(key, value)
-                    return
-
-                # Try to convert to basic type.
-                if field_type in {"Vector2", "Vector3", "Vector4"}:
-                    vector_type = {"Vector2": Vector2, "Vector3": Vector3, "Vector4": Vector4}[field_type]
-                    try:
-                        vector_value = vector_type(value)
-                    except (ValueError, TypeError):
-                        raise ValueError(
-                            f"Can only assign sequences or `{field_type}` to `{field_type}` "
-                            f"field `{self.cls_name}.{field_name}`, not: {value}"
+                        raise TypeError(
+                            f"Invalid type for entry list field `{self.cls_name}.{field_name}`: "
+                            f"{element.__class__.__name__}"
                         )
-                    super(MSBEntry, self).__setattr__(key, vector_value)
-                    return
-
-                if field_type in {"bool", "int", "float", "str"}:
-                    py_type = _BASIC_ENTRY_TYPES.get(field_type)
-                    if isinstance(value, int) and py_type is float:
-                        value = float(value)  # acceptable conversion
-                    elif not isinstance(value, py_type):
-                        raise TypeError(f"Invalid type for `{field_type}` field `{self.cls_name}.{field_name}: {value}")
-                    super(MSBEntry, self).__setattr__(key, value)
-                    return
-
-                # Shouldn't be able to reach this, but just in case.
+                while len(list_value) < length:
+                    list_value.append(None)
+            else:
+                raise TypeError(f"Invalid field type for `{self.cls_name}.{field_name}`: {field_type}")
+            super(MSBEntry, self).__setattr__(field_name, list_value)
+            return
+
+        if entry_type_name.startswith("MSB"):
+            # Single entry (or None).
+            if value is not None and not self._is_subtype(value, entry_type_name):
+                if not self._is_permitted_wrong_msb_entry_type(value):
+                    raise TypeError(
+                        f"Invalid type for entry field `{self.cls_name}.{field_name}` of '{self.name}': "
+                        f"{value.__class__.__name__} ({value})"
+                    )
+            super(MSBEntry, self).__setattr__(field_name, value)
+            return
+
+        if field_type in {"GroupBitSet128", "GroupBitSet256", "GroupBitSet1024"}:
+            # `GroupBitSet` subclass of some maximum count.
+            if not isinstance(value, (GroupBitSet128, GroupBitSet256, GroupBitSet1024)):
+                # Lists will be interpreted as packed uints, and sets as enabled bits.
+                if field_type.endswith("128"):
+                    value = GroupBitSet128(value)
+                elif field_type.endswith("256"):
+                    value = GroupBitSet256(value)
+                else:  # field_type.endswith("1024"):
+                    value = GroupBitSet1024(value)
+            super(MSBEntry, self).__setattr__(field_name, value)
+            return
+
+        # Type is exactly correct.
+        if type(value).__name__ == field_type:
+            super(MSBEntry, self).__setattr__(key, value)
+            return
+
+        # Try to convert to basic type.
+        if field_type in {"Vector2", "Vector3", "Vector4"}:
+            vector_type = _BASIC_ENTRY_TYPES[field_type]
+            try:
+                vector_value = vector_type(value)
+            except (ValueError, TypeError):
                 raise ValueError(
-                    f"Could not set/convert value {repr(value)} for assignment to field "
-                    f"`{self.cls_name}.{field_name}` (type `{field_type}`)."
+                    f"Can only assign sequences or `{field_type}` to `{field_type}` "
+                    f"field `{self.cls_name}.{field_name}`, not: {value}"
                 )
+            super(MSBEntry, self).__setattr__(key, vector_value)
+            return
 
-        raise ValueError(f"Invalid `MSBEntry` subclass field: `{self.cls_name}.{key}`")
+        if field_type in {"bool", "int", "float", "str"}:
+            py_type = _BASIC_ENTRY_TYPES.get(field_type)
+            if isinstance(value, int) and py_type is float:
+                value = float(value)  # acceptable conversion
+            elif not isinstance(value, py_type):
+                raise TypeError(f"Invalid type for `{field_type}` field `{self.cls_name}.{field_name}: {value}")
+            super(MSBEntry, self).__setattr__(key, value)
+            return
+
+        # Shouldn't be able to reach this, but just in case.
+        raise ValueError(
+            f"Could not set/convert value {repr(value)} for assignment to field "
+            f"`{self.cls_name}.{field_name}` (type `{field_type}`)."
+        )
 
     @classmethod
     def _is_subtype(cls, value: MSBEntry, parent_type_name: str) -> bool:
@@ -890,20 +892,24 @@ class MSBEntry(abc.ABC):
         if entry_or_entry_list is None:
             return -1  # non-set single entry
         if isinstance(entry_or_entry_list, list):
+            # Maps entry IDs to their first index in `entry_list`. Built once on demand, rather than scanning the list
+            # for every entry (e.g. 32 spawn parts).
+            entry_indices = {}  # type: dict[int, int]
             indices = []
             for entry in entry_or_entry_list:
                 if entry is None:
                     indices.append(-1)
-                else:
+                    continue
+                if not entry_indices:
                     for i, e in enumerate(entry_list):
-                        if e is entry:
-                            indices.append(i)
-                            break
-                    else:
-                        raise ValueError(
-                            f"Could not find referenced entry `{entry.name}` for "
-                            f"`{self.name}.{source_field_name}` in MSB list while packing."
-                        )
+                        entry_indices.setdefault(id(e), i)
+                try:
+                    indices.append(entry_indices[id(entry)])
+                except KeyError:
+                    raise ValueError(
+                        f"Could not find referenced entry `{entry.name}` for "
+                        f"`{self.name}.{source_field_name}` in MSB list while packing."
+                    )
             return indices
         # Otherwise, single entry.
         for i, e in enumerate(entry_list):
@@ -11,7 +11,6 @@ __all__ = [
 ]
 
 import abc
-import ast
 import json
 import logging
 import re
@@ -68,6 +67,10 @@ class MSBSubtypeInfo(tp.NamedTuple):
         return name.lower() in name_options
 
 
+# Comma-separated bit indices in parentheses, with an optional trailing comma (e.g. "()", "(1,)", or "(1, 2)").
+_BIT_TUPLE_PATTERN = r"\((?: *\d+ *(?:, *\d+ *)*,? *)?\)"
+
+
 @dataclass(slots=True)
 class GroupBitSet(abc.ABC):
     """Stores the huge, multi-`uint` bitfields used for draw/display/backread/navmesh groups in MSBs.
@@ -117,10 +120,10 @@ class GroupBitSet(abc.ABC):
         """Also handles JSON decoding."""
         if (match := cls._REPR_RE.match(repr_string)) is None:
             raise ValueError(f"Invalid string/JSON source for `{cls.__name__}`: {repr_string}")
-        bit_tuple = ast.literal_eval(match.group(1))
-        if isinstance(bit_tuple, int):
-            bit_tuple = (bit_tuple,)  # formatting quirk (no single comma for single-element tuple in JSON)
-        return cls(uint_list_or_bit_set=set(bit_tuple))
+        # Parsed directly rather than with `ast.literal_eval()`, as every MSB entry in a JSON file has several of these.
+        # Also handles the formatting quirk of no single comma for single-element tuple in JSON.
+        bits = {int(bit) for bit in match.group(1)[1:-1].split(",") if bit.strip()}
+        return cls(uint_list_or_bit_set=bits)
 
     def to_sorted_bit_list(self) -> list[int]:
         """For GUI display, mainly."""
@@ -185,20 +188,20 @@ class GroupBitSet(abc.ABC):
 @dataclass(slots=True, init=False, repr=False)
 class GroupBitSet128(GroupBitSet):
     BIT_COUNT: tp.ClassVar[int] = 128
-    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet128(\([\d, ]*\))$")
+    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(rf"^GroupBitSet128({_BIT_TUPLE_PATTERN})$")
 
 
 @dataclass(slots=True, init=False, repr=False)
 class GroupBitSet256(GroupBitSet):
     BIT_COUNT: tp.ClassVar[int] = 256
-    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet256(\([\d, ]*\))$")
+    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(rf"^GroupBitSet256({_BIT_TUPLE_PATTERN})$")
 
 
 @dataclass(slots=True, init=False, repr=False)
 class GroupBitSet1024(GroupBitSet):
     """For Part collision masks in Elden Ring."""
     BIT_COUNT: tp.ClassVar[int] = 1024
-    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(r"^GroupBitSet1024(\([\d, ]*\))$")
+    _REPR_RE: tp.ClassVar[re.Pattern] = re.compile(rf"^GroupBitSet1024({_BIT_TUPLE_PATTERN})$")
 
 
 def merge(msb_1: MSB, msb_2: MSB, filter_func: tp.Callable = None, allow_repeated_names=False) -> MSB:
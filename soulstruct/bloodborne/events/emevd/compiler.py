@@ -56,8 +56,8 @@ COMPILER = {}
 
 def compile_instruction(instr_name: str, *args, **kwargs) -> list[str]:
     """Compile instruction using `COMPILER` function if available, or fall back to `_auto_compile` below with EMEDF."""
-    if instr_name in COMPILER:
-        return COMPILER[instr_name](*args, **kwargs)
+    if (compile_func := COMPILER.get(instr_name)) is not None:
+        return compile_func(*args, **kwargs)
     return base_compile_instruction(EMEDF_ALIASES, instr_name, *args, **kwargs)
 
 
@@ -272,8 +272,8 @@ class MSBPart(BaseMSBPart, abc.ABC):
             packed_sib_path += b"\0" * (0x3c - strings_size)
         else:
             packed_sib_path += b"\0" * 8
-        while len(packed_description + packed_name + packed_sib_path) % 4 != 0:
-            packed_sib_path += b"\0"  # Not done in SoulsFormats, but makes sense to me.
+        # Not done in SoulsFormats, but makes sense to me.
+        packed_sib_path += b"\0" * (-len(packed_description + packed_name + packed_sib_path) % 4)
         writer.append(packed_sib_path)
 
 
@@ -11,25 +11,33 @@ __all__ = [
 ]
 
 import abc
+import array
 import logging
 import math
 import multiprocessing
-import re
 import shutil
+import sys
 import tempfile
 import typing as tp
 import zlib
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
 from enum import IntEnum
 from pathlib import Path
 
 from soulstruct.base.game_file import GameFile
 from soulstruct.base.textures.dds import *
 from soulstruct.base.textures.texconv import TexconvError, texconv
-from soulstruct.dcx import DCXType, decompress
+from soulstruct.dcx import DCXType, decompress, is_dcx
 from soulstruct.utilities.binary import *
 from soulstruct.utilities.files import read_json, write_json
 
+try:
+    # noinspection PyPackageRequirements
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
 
 try:
     Self = tp.Self
@@ -76,7 +84,30 @@ class TextureFloatStruct(BinaryStruct):
     size: int  # 4 * len(data)
 
     def unpack_data(self, reader: BinaryReader) -> list[float]:
-        return list(reader.unpack(f"{self.size}f"))
+        """Read `size` bytes of floats directly into an `array` (`size` is in bytes, not floats)."""
+        floats = array.array("f")
+        floats.frombytes(reader.read(self.size))
+        if (reader.default_byte_order == ByteOrder.BigEndian) != (sys.byteorder == "big"):
+            floats.byteswap()
+        return floats.tolist()
+
+    @staticmethod
+    def pack_data(writer: BinaryWriter, data: list[float]):
+        floats = array.array("f", data)
+        if (writer.default_byte_order == ByteOrder.BigEndian) != (sys.byteorder == "big"):
+            floats.byteswap()
+        writer.append(floats.tobytes())
+
+
+def _compress_texture_data(data: bytes) -> bytes:
+    """Compress texture data with zlib, using the much faster (SIMD-accelerated) `isal` package if it is installed.
+
+    `isal` only supports compression levels 0-3, so its highest level is used instead of `zlib` level 7. Output is a
+    standard zlib stream either way.
+    """
+    if isal_zlib is not None:
+        return isal_zlib.compress(data, isal_zlib.ISAL_BEST_COMPRESSION)
+    return zlib.compress(data, level=7)
 
 
 @dataclass(slots=True)
@@ -97,11 +128,16 @@ class TPFTexture:
     texture_type: TextureType = TextureType.Texture
     mipmap_count: int = 0
     texture_flags: int = 0  # {2, 3} -> DCX-compressed (i.e. bit 1); unknown otherwise
-    data: bytes = b""
+    data: bytes | memoryview = b""  # read-only view into source TPF data when unpacked without DCX compression
 
     header: TextureHeader | None = None  # only used for console textures to supplement headerless DDS
     unknown_float_struct: tuple[int, list[float]] | None = None
 
+    # DCX-compressed source data, only decompressed into `data` on first access (see `__getattr__`).
+    _dcx_data: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    # Exact `data` object decompressed from `_dcx_data`, paired with that compressed data for reuse when packing.
+    _decompressed_dcx_cache: tuple[bytes, bytes] | None = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def from_tpf_reader(
         cls,
@@ -112,47 +148,25 @@ class TPFTexture:
     ):
         texture_struct = TPFTextureStruct.from_bytes(reader)
 
-        if platform != TPFPlatform.PC:
-            width = reader["h"]
-            height = reader["h"]
-            header = TextureHeader(width, height)
-            if platform == TPFPlatform.Xbox360:
-                reader.assert_pad(4)
-            elif platform == TPFPlatform.PS3:
-                header.unk1 = reader["i"]
-                if tpf_flags != 0:
-                    header.unk2 = reader["i"]
-                    if header.unk2 not in {0, 0x68E0, 0xAAE4}:
-                        raise ValueError(
-                            f"`TextureHeader.unk2` was {header.unk2}, but expected 0, 0x68E0, or 0xAAE4."
-                        )
-            elif platform in {TPFPlatform.PS4, TPFPlatform.XboxOne}:
-                header.texture_count = reader["i"]
-                if header.texture_count not in {1, 6}:
-                    f"`TextureHeader.texture_count` was {header.texture_count}, but expected 1 or 6."
-                header.unk2 = reader["i"]
-                if header.unk2 != 0xD:
-                    f"`TextureHeader.unk2` was {header.unk2}, but expected 0xD."
-            # `dxgi_format` unpacked below.
-        else:
-            header = None
+        header, name_offset, has_unknown_float_struct = cls._unpack_header_tail(reader, platform, tpf_flags)
 
-        name_offset = reader["I"]
-        has_unknown_float_struct = reader["i"] == 1
-        if platform in {TPFPlatform.PS4, TPFPlatform.XboxOne}:
-            header.dxgi_format = DXGI_FORMAT(reader["i"])
-        if has_unknown_float_struct:
+        if has_unknown_float_struct == 1:
             float_struct = TextureFloatStruct.from_bytes(reader)
             unknown_float_struct = (float_struct.unk0, float_struct.unpack_data(reader))
         else:
             unknown_float_struct = None
 
-        with reader.temp_offset(texture_struct.pop("data_offset")):
-            data = reader.read(texture_struct.pop("data_size"))
+        data_offset = texture_struct.pop("data_offset")
+        data_size = texture_struct.pop("data_size")
         if texture_struct.texture_flags in {2, 3}:
-            # Data is DCX-compressed.
+            # Data is DCX-compressed. Decompression is deferred until `data` is first accessed.
             # TODO: should enforce DCX type as 'DCP_EDGE'?
-            data = decompress(data)
+            dcx_data = reader.read(data_size, offset=data_offset)
+            data = b""
+        else:
+            # Avoid copying (potentially large) texture data if possible.
+            dcx_data = None
+            data = reader.read_view(data_size, offset=data_offset)
 
         name = reader.unpack_string(offset=name_offset, encoding=encoding)
 
@@ -163,19 +177,78 @@ class TPFTexture:
             header=header,
             unknown_float_struct=unknown_float_struct,
         )
+        if dcx_data is not None:
+            del texture.data  # unset slot so that `__getattr__` is triggered on first access
+            texture._dcx_data = dcx_data
 
         return texture
 
+    @staticmethod
+    def _unpack_header_tail(
+        reader: BinaryReader, platform: TPFPlatform, tpf_flags: int
+    ) -> tuple[TextureHeader | None, int, int]:
+        """Unpack remainder of texture header after `TPFTextureStruct`, which varies by platform, with a single call.
+
+        Returns `TextureHeader` (console only), name offset, and unknown float struct flag (1 if present).
+        """
+        if platform == TPFPlatform.PC:
+            header = None
+            name_offset, has_unknown_float_struct = reader.unpack("Ii")
+        elif platform == TPFPlatform.Xbox360:
+            width, height, padding, name_offset, has_unknown_float_struct = reader.unpack("hh4sIi")
+            if padding.strip(b"\0"):
+                raise ValueError(f"Xbox360 `TextureHeader` padding contained non-null bytes: {padding}")
+            header = TextureHeader(width, height)
+        elif platform == TPFPlatform.PS3:
+            if tpf_flags != 0:
+                width, height, unk1, unk2, name_offset, has_unknown_float_struct = reader.unpack("hhiiIi")
+                if unk2 not in {0, 0x68E0, 0xAAE4}:
+                    raise ValueError(f"`TextureHeader.unk2` was {unk2}, but expected 0, 0x68E0, or 0xAAE4.")
+            else:
+                width, height, unk1, name_offset, has_unknown_float_struct = reader.unpack("hhiIi")
+                unk2 = 0
+            header = TextureHeader(width, height, unk1=unk1, unk2=unk2)
+        else:  # PS4, XboxOne
+            (
+                width, height, texture_count, unk2, name_offset, has_unknown_float_struct, dxgi_format
+            ) = reader.unpack("hhiiIii")
+            if texture_count not in {1, 6}:
+                _LOGGER.warning(f"`TextureHeader.texture_count` was {texture_count}, but expected 1 or 6.")
+            if unk2 != 0xD:
+                _LOGGER.warning(f"`TextureHeader.unk2` was {unk2}, but expected 0xD.")
+            header = TextureHeader(width, height, texture_count, unk2=unk2, dxgi_format=DXGI_FORMAT(dxgi_format))
+
+        return header, name_offset, has_unknown_float_struct
+
+    def __getattr__(self, name: str):
+        """Only called when a slot is unset, which is only expected for DCX-compressed `data` not yet decompressed."""
+        if name == "data" and self._dcx_data is not None:
+            dcx_data = self._dcx_data
+            # Also clears `_dcx_data`. Data without a DCX header is a raw `zlib` stream, as written by `pack_data()`.
+            if is_dcx(BinaryReader(dcx_data)):
+                self.data, _ = decompress(dcx_data)
+            else:
+                self.data = zlib.decompress(dcx_data)
+            self._decompressed_dcx_cache = (self.data, dcx_data)
+            return self.data
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: tp.Any):
+        """Setting `data` discards any DCX-compressed source data that was never decompressed, as it is now stale."""
+        if name == "data":
+            object.__setattr__(self, "_dcx_data", None)
+        object.__setattr__(self, name, value)
+
     def to_tpf_writer(self, writer: BinaryWriter, platform: TPFPlatform, tpf_flags: int):
         if platform == TPFPlatform.PC:
-            dds = self.get_dds()
-            if dds.header.caps2 & DDSCAPS2.CUBEMAP:
+            dds_header = self.get_dds_header()
+            if dds_header.caps2 & DDSCAPS2.CUBEMAP:
                 texture_type = TextureType.Cubemap
-            elif dds.header.caps2 & DDSCAPS2.VOLUME:
+            elif dds_header.caps2 & DDSCAPS2.VOLUME:
                 texture_type = TextureType.Volume
             else:
                 texture_type = TextureType.Texture
-            mipmap_count = dds.header.mipmap_count
+            mipmap_count = dds_header.mipmap_count
         else:
             texture_type = self.texture_type
             mipmap_count = self.mipmap_count
@@ -189,29 +262,32 @@ class TPFTexture:
             mipmap_count=mipmap_count,
         )
 
-        if platform != TPFPlatform.PC:
-            writer.pack("h", self.header.width)
-            writer.pack("h", self.header.height)
-            if platform == TPFPlatform.Xbox360:
-                writer.pad(4)
-            elif platform == TPFPlatform.PS3:
-                writer.pack("i", self.header.unk1)
-                if tpf_flags != 0:
-                    writer.pack("i", self.header.unk2)
-            elif platform in {TPFPlatform.PS4, TPFPlatform.XboxOne}:
-                writer.pack("i", self.header.texture_count)
-                writer.pack("i", self.header.unk2)
-
-        writer.reserve("name_offset", "I", obj=self)
-        writer.pack("i", 0 if self.unknown_float_struct is None else 1)
-
-        if platform in {TPFPlatform.PS4, TPFPlatform.XboxOne}:
-            writer.pack("i", self.header.dxgi_format)
+        # Remainder of texture header varies by platform. Fields on either side of `name_offset` are packed together.
+        header = self.header
+        has_unknown_float_struct = 0 if self.unknown_float_struct is None else 1
+        if platform == TPFPlatform.PC:
+            writer.reserve("name_offset", "I", obj=self)
+            writer.pack("i", has_unknown_float_struct)
+        elif platform == TPFPlatform.Xbox360:
+            writer.pack("hh4x", header.width, header.height)
+            writer.reserve("name_offset", "I", obj=self)
+            writer.pack("i", has_unknown_float_struct)
+        elif platform == TPFPlatform.PS3:
+            if tpf_flags != 0:
+                writer.pack("hhii", header.width, header.height, header.unk1, header.unk2)
+            else:
+                writer.pack("hhi", header.width, header.height, header.unk1)
+            writer.reserve("name_offset", "I", obj=self)
+            writer.pack("i", has_unknown_float_struct)
+        else:  # PS4, XboxOne
+            writer.pack("hhii", header.width, header.height, header.texture_count, header.unk2)
+            writer.reserve("name_offset", "I", obj=self)
+            writer.pack("ii", has_unknown_float_struct, header.dxgi_format)
 
         if self.unknown_float_struct is not None:
             unk0, floats = self.unknown_float_struct
             TextureFloatStruct(unk0, len(floats) * 4).to_writer(writer)
-            writer.pack(f"{len(floats) * 4}f", *floats)
+            TextureFloatStruct.pack_data(writer, floats)
 
     def pack_name(self, writer: BinaryWriter, encoding_type: int):
         writer.fill_with_position("name_offset", obj=self)
@@ -223,22 +299,45 @@ class TPFTexture:
             raise ValueError(f"Invalid TPF texture encoding: {encoding_type}. Must be 0, 1, or 2.")
         writer.append(name)
 
-    def pack_data(self, writer: BinaryWriter):
+    def pack_data(self, writer: BinaryWriter, packed_data: bytes = None):
+        """Pack texture data (compressed if required), or `packed_data` if it has already been prepared by caller."""
         writer.fill_with_position("data_offset", obj=self)
-        if self.texture_flags in {2, 3}:
-            data = zlib.compress(self.data, level=7)
+        if packed_data is not None:
+            data = packed_data
+        elif self.texture_flags in {2, 3}:
+            if (data := self.get_unchanged_dcx_data()) is None:
+                data = _compress_texture_data(self.data)
         else:
             data = self.data
 
         writer.fill("data_size", len(data), obj=self)
         writer.append(data)
 
+    def get_unchanged_dcx_data(self) -> bytes | None:
+        """Get original DCX-compressed `data` if it was never decompressed, or has not been replaced since.
+
+        Only returned if `texture_flags` still requires compression. The original data is written back verbatim,
+        whatever its DCX header, so unchanged textures repack exactly as they were loaded.
+        """
+        if self.texture_flags not in {2, 3}:
+            return None
+        if self._dcx_data is not None:
+            dcx_data = self._dcx_data
+        elif self._decompressed_dcx_cache is not None and self._decompressed_dcx_cache[0] is self.data:
+            dcx_data = self._decompressed_dcx_cache[1]
+        else:
+            return None
+        return dcx_data
+
     def get_dds(self) -> DDS:
         return DDS.from_bytes(self.data)
 
+    def get_dds_header(self) -> DDSHeader:
+        """Parse only the DDS header of `data`, without copying the rest of it like `get_dds()`."""
+        return DDSHeader.from_bytes(bytes(self.data[:DDSHeader.get_size()]))
+
     def get_dds_fourcc(self) -> bytes:
-        dds_header = DDSHeader.from_bytes(self.data)  # only need the header
-        return dds_header.pixelformat.fourcc
+        return self.get_dds_header().pixelformat.fourcc
 
     def write_dds(self, dds_path: str | Path):
         Path(dds_path).write_bytes(self.data)
@@ -272,19 +371,19 @@ class TPFTexture:
                     f"   stderr: {result.stderr}"
                 )
 
+    def get_full_dds_data(self, platform=TPFPlatform.PC) -> bytes:
+        """Get `data`, with an automatically generated DDS header if it is a headerless console texture."""
+        if self.data[:4] == b"DDS ":
+            return self.data  # already has header
+        if not self.header:
+            raise TexconvError("Cannot convert headerless DDS texture to PNG without a `TPFTexture` header.")
+        return bytes(self.get_headerized_dds(platform))
+
     def get_png_data(self, fmt="rgba", platform=TPFPlatform.PC) -> bytes:
         with tempfile.TemporaryDirectory() as png_dir:
             temp_dds_path = Path(png_dir, "temp.dds")
-
-            if not self.data[:4] == b"DDS ":
-                if not self.header:
-                    raise TexconvError("Cannot convert headerless DDS texture to PNG without a `TPFTexture` header.")
-                dds_data = bytes(self.get_headerized_dds(platform))
-            else:
-                dds_data = self.data  # already has header
-
+            dds_data = self.get_full_dds_data(platform)
             temp_dds_path.write_bytes(dds_data)
-            Path("~/Documents/temp.dds").expanduser().write_bytes(dds_data)
             texconv_result = texconv("-o", png_dir, "-ft", "png", "-f", fmt, "-nologo", temp_dds_path)
             try:
                 return Path(png_dir, "temp.png").read_bytes()
@@ -301,16 +400,17 @@ class TPFTexture:
         dds = self.get_dds()
         current_format = dds.header.pixelformat.fourcc.decode()
         current_dxgi_format = dds.dx10_header.dxgi_format if dds.dx10_header else None
-        if assert_input_format is not None and current_format != assert_input_format.encode():
+        if assert_input_format is not None and current_format != assert_input_format:
             raise ValueError(
-                f"TPF texture DDS format {current_format} does not match "
-                f"`assert_input_format` {assert_input_format} ({current_format}"
+                f"TPF texture DDS format {current_format} does not match `assert_input_format` {assert_input_format}."
             )
-        temp_dds_path = Path(__file__).parent / "__temp__.dds"
-        temp_dds_path.write_bytes(self.data)
-        result = convert_dds_file(temp_dds_path, Path(__file__).parent, output_format)  # overwrite temp file
+        with tempfile.TemporaryDirectory() as dds_dir:
+            temp_dds_path = Path(dds_dir, "temp.dds")
+            temp_dds_path.write_bytes(self.data)
+            result = convert_dds_file(temp_dds_path, dds_dir, output_format)  # overwrite temp file
+            converted_data = temp_dds_path.read_bytes() if result.returncode == 0 else None
         if result.returncode == 0:
-            self.data = temp_dds_path.read_bytes()
+            self.data = converted_data
             if current_dxgi_format:
                 _LOGGER.info(
                     f"Converted TPF texture {self.name} from format {current_format} "
@@ -504,6 +604,14 @@ class TPFTexture:
                     padded_height = DDSImage.pad_to(current_height, 32)
                     padded_size = DDSImage.pad_to(padded_width, 4) * DDSImage.pad_to(padded_height, 4) * block_size
 
+    def __getstate__(self):
+        """Copy `data` to `bytes` if it is a `memoryview` (which cannot be pickled) and discard DCX cache."""
+        slot_state = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "data"}
+        if self._dcx_data is None:  # otherwise, `data` remains unset (and compressed)
+            slot_state["data"] = bytes(self.data)
+        slot_state["_decompressed_dcx_cache"] = None
+        return None, slot_state
+
     def __repr__(self) -> str:
         return (
             f"TPFTexture(\n"
@@ -553,6 +661,32 @@ class TPF(GameFile):
             textures=textures, platform=platform, encoding_type=tpf_struct.encoding_type, tpf_flags=tpf_struct.tpf_flags
         )
 
+    @classmethod
+    def get_texture_names(cls, data: bytes | BinaryReader) -> list[str]:
+        """Read only the texture names from TPF `data` (decompressing DCX if needed), without reading any texture data
+        or creating `TPFTexture` instances. Useful for quickly checking which TPFs are worth fully unpacking."""
+        reader = BinaryReader(data)
+        if is_dcx(reader):
+            data, _ = decompress(reader)
+            reader = BinaryReader(data)
+        platform = TPFPlatform(reader["B", 0xC])
+        reader.default_byte_order = ByteOrder.big_endian_bool(platform in {TPFPlatform.Xbox360, TPFPlatform.PS3})
+        tpf_struct = TPFStruct.from_bytes(reader)
+
+        encoding = reader.get_utf_16_encoding() if tpf_struct.encoding_type == 1 else "shift_jis_2004"
+        texture_struct_size = TPFTextureStruct.get_size()
+        name_offsets = []
+        for _ in range(tpf_struct.file_count):
+            reader.seek(texture_struct_size, 1)  # skip to platform-specific header (containing name offset)
+            _, name_offset, has_unknown_float_struct = TPFTexture._unpack_header_tail(
+                reader, platform, tpf_struct.tpf_flags
+            )
+            if has_unknown_float_struct == 1:
+                float_struct = TextureFloatStruct.from_bytes(reader)
+                reader.seek(float_struct.size, 1)
+            name_offsets.append(name_offset)
+        return [reader.unpack_string(offset=name_offset, encoding=encoding) for name_offset in name_offsets]
+
     @classmethod
     def from_unpacked_path(cls, path: str | Path) -> Self:
         """Load manifest JSON or unpacked TPF directory containing a manifest JSON."""
@@ -616,12 +750,31 @@ class TPF(GameFile):
         for texture in self.textures:
             texture.pack_name(writer, self.encoding_type)
 
+        # Prepare DCX texture data up front: unchanged compressed data is reused, and the rest is compressed here, in
+        # parallel if worthwhile (`zlib` and `isal` both release the GIL).
+        packed_datas = [
+            texture.get_unchanged_dcx_data() for texture in self.textures
+        ]  # type: list[bytes | None]
+        compressed_indices = [
+            i for i, (texture, packed_data) in enumerate(zip(self.textures, packed_datas))
+            if texture.texture_flags in {2, 3} and packed_data is None
+        ]
+        if len(compressed_indices) >= 4:
+            with ThreadPoolExecutor() as executor:
+                compressed_datas = list(executor.map(
+                    _compress_texture_data, [self.textures[i].data for i in compressed_indices]
+                ))
+        else:
+            compressed_datas = [_compress_texture_data(self.textures[i].data) for i in compressed_indices]
+        for i, compressed_data in zip(compressed_indices, compressed_datas):
+            packed_datas[i] = compressed_data
+
         data_start = writer.position
-        for texture in self.textures:
+        for texture, packed_data in zip(self.textures, packed_datas):
             # TKGP notes: padding varies wildly across games, so don't worry about it too much.
-            if len(texture.data) > 0:
+            if packed_data is not None or len(texture.data) > 0:
                 writer.pad_align(4)
-            texture.pack_data(writer)
+            texture.pack_data(writer, packed_data)
         writer.fill("_data_size", writer.position - data_start, obj=self)
         writer.fill("file_count", len(self.textures), obj=self)
         return writer
@@ -678,17 +831,20 @@ class TPF(GameFile):
     def convert_dds_formats(self, input_format: str, output_format: str):
         """Convert all DDS files that currently have format `input_format` to `output_format`.
 
-        Formats should look like b"DX10", b"DXT1", etc.
+        Formats should look like "DX10", "DXT1", etc.
         """
-        fail_count = 0
-        total_count = 0
-        for texture in self.textures:
-            dds = texture.get_dds()
-            if dds.fourcc == input_format:
-                success = texture.convert_dds_format(output_format)
-                total_count += 1
-                if not success:
-                    fail_count += 1
+        # Only DDS headers are parsed here. `convert_dds_format()` parses each converted texture fully, once.
+        textures_to_convert = [
+            texture for texture in self.textures
+            if texture.get_dds_fourcc().rstrip(b"\0").decode() == input_format
+        ]
+        if not textures_to_convert:
+            return
+        # Each conversion is spent waiting on its own `texconv` subprocess, so threads can run them concurrently.
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(lambda texture: texture.convert_dds_format(output_format), textures_to_convert))
+        fail_count = results.count(False)
+        total_count = len(results)
         if fail_count > 0:
             _LOGGER.warning(
                 f"Failed to convert {fail_count} out of {total_count} textures from {input_format} to {output_format}."
@@ -702,22 +858,73 @@ class TPF(GameFile):
         raise ValueError(f"Could not find texture with name {name}.")
 
     def get_all_png_data(self, fmt="rgba") -> list[tp.Optional[bytes]]:
-        png_datas = []
-        for tex in self.textures:
+        """Convert all textures to PNG data, using threads (as each conversion is spent waiting on `texconv`).
+
+        Textures that fail to convert will have `None` in the returned list.
+        """
+
+        def get_png_data_or_none(tex: TPFTexture) -> bytes | None:
             try:
-                png_datas.append(tex.get_png_data(fmt))
+                return tex.get_png_data(fmt)
             except ValueError as ex:
                 _LOGGER.warning(str(ex))
-                png_datas.append(None)
+                return None
+
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(get_png_data_or_none, self.textures))
+
+    def get_all_png_data_batched(self, fmt="rgba") -> list[tp.Optional[bytes]]:
+        """As `get_all_png_data()`, but writes all DDS textures to one temporary directory and converts them all with a
+        single `texconv` call, rather than one subprocess per texture.
+
+        Textures that fail to convert will have `None` in the returned list.
+        """
+        png_datas = [None] * len(self.textures)  # type: list[tp.Optional[bytes]]
+        with tempfile.TemporaryDirectory() as png_dir:
+            dds_paths = []
+            for i, tex in enumerate(self.textures):
+                try:
+                    dds_data = tex.get_full_dds_data(self.platform)
+                except (TexconvError, DDSDeswizzlerError) as ex:
+                    _LOGGER.warning(str(ex))
+                    continue
+                dds_path = Path(png_dir, f"tex{i}.dds")
+                dds_path.write_bytes(dds_data)
+                dds_paths.append(dds_path)
+            if not dds_paths:
+                return png_datas
+
+            # Input paths are passed in a file list to avoid command line length limits.
+            file_list_path = Path(png_dir, "file_list.txt")
+            file_list_path.write_text("\n".join(str(dds_path) for dds_path in dds_paths))
+            texconv_result = texconv("-o", png_dir, "-ft", "png", "-f", fmt, "-nologo", "-flist", file_list_path)
+
+            for dds_path in dds_paths:
+                i = int(dds_path.stem[3:])
+                try:
+                    png_datas[i] = dds_path.with_suffix(".png").read_bytes()
+                except FileNotFoundError:
+                    _LOGGER.warning(
+                        f"Could not convert TPF texture {self.textures[i].name} to PNG:\n"
+                        f"    {texconv_result.stdout.decode()}"
+                    )
         return png_datas
 
     def export_to_pngs(self, png_dir_path: Path | str, fmt="rgba"):
-        for tex in self.textures:
-            png_name = Path(tex.name).with_suffix(".png")
-            try:
-                tex.export_png(png_dir_path / png_name, fmt=fmt, platform=self.platform)
-            except ValueError as ex:
-                _LOGGER.warning(str(ex))
+        """Export all textures to PNG files in `png_dir_path`, using threads (see `get_all_png_data()`)."""
+        png_dir_path = Path(png_dir_path)
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    tex.export_png, png_dir_path / Path(tex.name).with_suffix(".png"), fmt=fmt, platform=self.platform
+                )
+                for tex in self.textures
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except ValueError as ex:
+                    _LOGGER.warning(str(ex))
 
     def __iter__(self) -> tp.Iterator[TPFTexture]:
         return iter(self.textures)
@@ -737,25 +944,38 @@ class TPF(GameFile):
 
     @classmethod
     def collect_tpf_textures(
-        cls, tpfbhd_directory: str | Path, convert_formats: tp.Tuple[str, str] = None
+        cls,
+        tpfbhd_directory: str | Path,
+        convert_formats: tp.Tuple[str, str] = None,
+        name_filter: tp.Callable[[str], bool] = None,
     ) -> dict[str, TPFTexture]:
         """Build a dictionary mapping TGA texture names to `TPFTexture` instances.
 
+        If `name_filter` is given, only textures whose names pass it are collected, and TPFs with no such textures are
+        skipped after reading only their texture names (see `get_texture_names()`).
+
         NOTE: This decompresses/unpacks every TPF in every BXF in the directory, which can be slow and redundant. Use
         `collect_tpf_entries()` above and only open the TPFs needed (since map TPFBHD TPFs should only have one DDS
         texture in them matching the TPF entry name).
         """
         from soulstruct.containers import Binder
 
-        tpf_re = re.compile(rf"(.*)\.tpf(\.dcx)?$")
         tpfbhd_directory = Path(tpfbhd_directory)
         textures = {}
         for bhd_path in tpfbhd_directory.glob("*.tpfbhd"):
             bxf = Binder.from_path(bhd_path)
             for entry in bxf.entries:
-                match = tpf_re.match(entry.name)
-                if match:
-                    tpf = cls.from_bytes(entry.data)
+                if entry.name.endswith((".tpf", ".tpf.dcx")):
+                    tpf_data = entry.data
+                    if name_filter is not None:
+                        reader = BinaryReader(tpf_data)
+                        if is_dcx(reader):
+                            tpf_data, _ = decompress(reader)  # only decompress once
+                        if not any(name_filter(name) for name in cls.get_texture_names(tpf_data)):
+                            continue
+                    tpf = cls.from_bytes(tpf_data)
+                    if name_filter is not None:
+                        tpf.textures = [texture for texture in tpf.textures if name_filter(texture.name)]
                     if convert_formats is not None:
                         input_format, output_format = convert_formats
                         tpf.convert_dds_formats(input_format, output_format)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 __all__ = ["NVMBND"]
 
+import multiprocessing
+import typing as tp
 from dataclasses import dataclass, field
 
 from soulstruct.containers import Binder, BinderEntry, BinderVersion, BinderVersion4Info
@@ -9,10 +11,23 @@ from soulstruct.dcx import DCXType
 from .nvm import NVM
 
 
+def _unpack_nvm(entry: BinderEntry) -> NVM:
+    return entry.to_binary_file(NVM)
+
+
+def _pack_nvm(nvm: NVM) -> bytes:
+    return bytes(nvm)
+
+
 @dataclass(slots=True)
 class NVMBND(Binder):
     """Manage `NVM` entries in a Binder."""
 
+    # Number of worker processes used to unpack NVMs on load and pack them in `entry_autogen()`. NVM (un)packing is pure
+    # Python, so only separate processes can run it in parallel. Disabled by default, as Windows scripts that enable it
+    # must then be protected by an `if __name__ == "__main__"` guard.
+    PROCESSES: tp.ClassVar[int] = 1
+
     # Override defaults.
     version: BinderVersion = BinderVersion.V3
     v4_info: BinderVersion4Info | None = None
@@ -22,27 +37,44 @@ class NVMBND(Binder):
     nvms: dict[str, NVM] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Loads FIRST instance of each entry name as an MTD."""
+        """Loads FIRST instance of each entry name as an NVM."""
         super(NVMBND, self).__post_init__()
 
         if self.nvms:
             return  # already passed in
 
-        self.nvms = {}
+        nvm_entries = {}
         for entry in self.entries:
-            if entry.name in self.nvms:
+            if entry.minimal_stem in nvm_entries:
                 continue  # ignore repeated names silently
-            self.nvms[entry.minimal_stem] = entry.to_binary_file(NVM)
+            nvm_entries[entry.minimal_stem] = entry
+
+        if self._use_processes(len(nvm_entries)):
+            with multiprocessing.Pool(processes=self.PROCESSES) as pool:
+                nvms = pool.map(_unpack_nvm, nvm_entries.values())
+        else:
+            nvms = [_unpack_nvm(entry) for entry in nvm_entries.values()]
+        self.nvms = dict(zip(nvm_entries.keys(), nvms))
 
     def entry_autogen(self):
         """Generate `NVM` entries from `NVM` instances."""
         self.entries = []
         sorted_nvm_stems = sorted(self.nvms.keys())
-        for i, nvm_stem in enumerate(sorted_nvm_stems):
+        sorted_nvms = [self.nvms[nvm_stem] for nvm_stem in sorted_nvm_stems]
+        if self._use_processes(len(sorted_nvms)):
+            with multiprocessing.Pool(processes=self.PROCESSES) as pool:
+                nvm_datas = pool.map(_pack_nvm, sorted_nvms)
+        else:
+            nvm_datas = [_pack_nvm(nvm) for nvm in sorted_nvms]
+        for i, (nvm_stem, nvm_data) in enumerate(zip(sorted_nvm_stems, nvm_datas)):
             self.entries.append(
-                BinderEntry(bytes(self.nvms[nvm_stem]), entry_id=i, path=self.get_nvm_entry_path(nvm_stem), flags=0x2)
+                BinderEntry(nvm_data, entry_id=i, path=self.get_nvm_entry_path(nvm_stem), flags=0x2)
             )
 
+    def _use_processes(self, nvm_count: int) -> bool:
+        """Only worth starting a process pool for several NVMs, and pool workers cannot start their own pools."""
+        return self.PROCESSES > 1 and nvm_count >= 4 and not multiprocessing.current_process().daemon
+
     def get_nvm_entry_path(self, nvm_stem: str) -> str:
 
         if not self.map_stem:
@@ -71,8 +71,7 @@ class MSBModel(BaseMSBModel):
             packed_sib_path = self.sib_path.encode(self.NAME_ENCODING) + self.NULL
         else:
             packed_sib_path = self.EMPTY_SIB_PATH
-        while len(packed_name + packed_sib_path) % 4 != 0:
-            packed_sib_path += b"\0"
+        packed_sib_path += b"\0" * (-len(packed_name + packed_sib_path) % 4)
         writer.append(packed_sib_path)
 
     def to_dict(self, ignore_defaults=True) -> dict[str, tp.Any]:
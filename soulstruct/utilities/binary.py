@@ -42,6 +42,7 @@ __all__ = [
 import copy
 import dataclasses
 import enum
+import functools
 import hashlib
 import io
 import logging
@@ -121,6 +122,30 @@ def long_varints_from_reader_peek(
         raise ValueError(f"Could not determine `long_varints` from bytes: {peeked}")
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_fmt(fmt: str, byte_order: ByteOrder, long_varints: bool) -> str:
+    """Cached implementation of `BinaryBase.parse_fmt()`. The same handful of fmts are parsed for every struct read."""
+    if fmt[0] not in "@=><!":
+        fmt = byte_order.value + fmt
+    if long_varints:
+        return fmt.replace("v", "q").replace("V", "Q")
+    return fmt.replace("v", "i").replace("V", "I")
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct(parsed_fmt: str) -> struct.Struct:
+    """Get compiled `struct.Struct` for an already-parsed fmt (with byte order and no var ints)."""
+    return struct.Struct(parsed_fmt)
+
+
+def _vector_to_floats(vector: Vector2 | Vector3 | Vector4 | tp.Sequence[float]) -> tp.Sequence[float]:
+    """Default `pack_func` for `Vector` fields. `struct.pack()` takes Python floats much faster than iterated numpy
+    `float64` elements."""
+    if isinstance(vector, (Vector2, Vector3, Vector4)):
+        return vector.data.tolist()
+    return vector
+
+
 class BinaryBase:
 
     # Special format characters that become 'iI' or 'qQ' depending on `var_int_size`.
@@ -135,17 +160,11 @@ class BinaryBase:
 
     def parse_fmt(self, fmt: str) -> str:
         """Insert default byte order and replace 'vV' var int characters."""
-        if fmt[0] not in "@=><!":
-            fmt = self.default_byte_order.value + fmt
-        if self.long_varints:
-            fmt = fmt.replace("v", "q").replace("V", "Q")
-        else:
-            fmt = fmt.replace("v", "i").replace("V", "I")
-        return fmt
+        return _parse_fmt(fmt, self.default_byte_order, self.long_varints)
 
     def calcsize(self, fmt: str) -> int:
         """Calculate fmt struct size after parsing it."""
-        return struct.calcsize(self.parse_fmt(fmt))
+        return _get_struct(self.parse_fmt(fmt)).size
 
     def get_utf_16_encoding(self) -> str:
         return self.default_byte_order.get_utf_16_encoding()
@@ -160,6 +179,7 @@ class BinaryReader(BinaryBase):
 
     buffer: tp.BinaryIO | io.BufferedIOBase | None
     path: Path | None  # optional path to file source
+    source_bytes: bytes | None  # immutable source data (if given), which `read_view()` can slice without copying
 
     def __init__(
         self,
@@ -171,6 +191,7 @@ class BinaryReader(BinaryBase):
 
         self.buffer = None
         self.path = None
+        self.source_bytes = None
 
         if isinstance(buffer, str):
             buffer = Path(buffer)
@@ -179,10 +200,13 @@ class BinaryReader(BinaryBase):
             self.path = buffer
         elif isinstance(buffer, (bytes, bytearray)):
             self.buffer = io.BytesIO(buffer)
+            if isinstance(buffer, bytes):
+                self.source_bytes = buffer
         elif isinstance(buffer, io.BufferedIOBase):
             self.buffer = buffer
         elif isinstance(buffer, BinaryReader):
             self.buffer = buffer.buffer
+            self.source_bytes = buffer.source_bytes
         else:
             try:
                 data = bytes(buffer)
@@ -191,6 +215,7 @@ class BinaryReader(BinaryBase):
                     f"Invalid `buffer`: {buffer}. Should be a binary IO stream, `bytes, or `Path` of a file to open."
                 )
             self.buffer = io.BytesIO(data)
+            self.source_bytes = data
 
     def unpack(self, fmt, offset=None, relative_offset=False, asserted=None) -> tuple:
         """Unpack appropriate number of bytes from `buffer` using `fmt` string from the given (or current) `offset`.
@@ -204,16 +229,37 @@ class BinaryReader(BinaryBase):
         Returns:
             (tuple) Output of `struct.unpack()`.
         """
-        fmt = self.parse_fmt(fmt)
+        fmt_struct = _get_struct(self.parse_fmt(fmt))
+
+        if self.source_bytes is not None:
+            # Unpack directly from source data rather than copying it out of the buffer first. Reads at a given
+            # `offset` do not need to move the buffer at all.
+            if offset is None:
+                position = self.buffer.tell()
+            elif relative_offset:
+                position = self.buffer.tell() + offset
+            else:
+                position = offset
+            if position < 0:
+                raise ValueError(f"Negative offset: {position}")
+            if position >= len(self.source_bytes) and fmt_struct.size > 0:
+                raise ValueError(
+                    f"Could not unpack {fmt_struct.size} bytes from reader for format '{fmt_struct.format}'."
+                )
+            data = fmt_struct.unpack_from(self.source_bytes, position)
+            if offset is None:
+                self.buffer.seek(position + fmt_struct.size)
+            if asserted is not None and data != asserted:
+                raise AssertionError(f"Unpacked data {repr(data)} does not equal asserted data {repr(asserted)}.")
+            return data
 
         initial_offset = self.buffer.tell() if offset is not None else None
         if offset is not None:
             self.buffer.seek(initial_offset + offset if relative_offset else offset)
-        fmt_size = struct.calcsize(fmt)
-        raw_data = self.buffer.read(fmt_size)
-        if not raw_data and fmt_size > 0:
-            raise ValueError(f"Could not unpack {fmt_size} bytes from reader for format '{fmt}'.")
-        data = struct.unpack(fmt, raw_data)
+        raw_data = self.buffer.read(fmt_struct.size)
+        if not raw_data and fmt_struct.size > 0:
+            raise ValueError(f"Could not unpack {fmt_struct.size} bytes from reader for format '{fmt_struct.format}'.")
+        data = fmt_struct.unpack(raw_data)
         if asserted is not None and data != asserted:
             raise AssertionError(f"Unpacked data {repr(data)} does not equal asserted data {repr(asserted)}.")
         if initial_offset is not None:
@@ -262,6 +308,8 @@ class BinaryReader(BinaryBase):
 
         See `read_chars_from_buffer()` for more.
         """
+        if length is None and self.source_bytes is not None:
+            return self._unpack_null_terminated(offset, reset_old_offset, bytes_per_char=1)
         return read_chars_from_buffer(self.buffer, offset, length, reset_old_offset, encoding=None, strip=strip)
 
     def unpack_string(
@@ -277,17 +325,50 @@ class BinaryReader(BinaryBase):
         Encoding defaults to "utf-8". If a "utf-16" encoding is given, two bytes will be read at a time, and a double
         null terminator is required. See `read_chars_from_buffer()` for more.
         """
+        if length is None and self.source_bytes is not None:
+            bytes_per_char = 2 if encoding is not None and encoding.replace("-", "").startswith("utf16le") else 1
+            return self._unpack_null_terminated(offset, reset_old_offset, bytes_per_char).decode(encoding)
         try:
             return read_chars_from_buffer(self.buffer, offset, length, reset_old_offset, encoding=encoding, strip=strip)
         except struct.error as ex:
             raise self.ReaderError(f"Could not unpack string. Error: {ex}")
 
+    def _unpack_null_terminated(self, offset: int | None, reset_old_offset: bool, bytes_per_char: int) -> bytes:
+        """Find the null terminator in `source_bytes` with `bytes.find()` rather than reading one char at a time.
+
+        Buffer position is left exactly as `read_chars_from_buffer()` would leave it.
+        """
+        start = self.buffer.tell() if offset is None else offset
+        terminator = b"\0" * bytes_per_char
+        end = self.source_bytes.find(terminator, start)
+        while end != -1 and (end - start) % bytes_per_char:
+            # Terminator must be aligned to whole characters from `start`.
+            end = self.source_bytes.find(terminator, end + 1)
+        if end == -1:
+            raise ValueError("Ran out of bytes to read before null termination was found.")
+        if offset is None or not reset_old_offset:
+            self.buffer.seek(end + bytes_per_char)
+        return self.source_bytes[start:end]
+
     def read(self, size: int = None, offset: int = None) -> bytes:
         if offset is not None:
             with self.temp_offset(offset):
                 return self.buffer.read(size)
         return self.buffer.read(size)
 
+    def read_view(self, size: int, offset: int = None) -> memoryview | bytes:
+        """As `read()`, but returns a zero-copy `memoryview` slice of `source_bytes` if available.
+
+        Falls back to `read()` (returning a new `bytes` copy) for file and stream sources.
+        """
+        if self.source_bytes is None:
+            return self.read(size, offset)
+        start = self.buffer.tell() if offset is None else offset
+        view = memoryview(self.source_bytes)[start:start + size]
+        if offset is None:
+            self.buffer.seek(start + len(view))
+        return view
+
     def seek(self, offset: int, whence=None) -> int:
         """Returns final position.
 
@@ -368,10 +449,10 @@ class BinaryWriter(BinaryBase):
         self.reserved = {}
 
     def pack(self, fmt: str, *values):
-        self._array += struct.pack(self.parse_fmt(fmt), *values)
+        self._array += _get_struct(self.parse_fmt(fmt)).pack(*values)
 
     def pack_at(self, offset: int, fmt: str, *values):
-        packed = struct.pack(self.parse_fmt(fmt), *values)
+        packed = _get_struct(self.parse_fmt(fmt)).pack(*values)
         self._array[offset:offset + len(packed)] = packed
 
     def pack_z_string(self, value: str, encoding="utf-8"):
@@ -1002,6 +1083,11 @@ class BinaryStruct:
     _FIELD_METADATA: tp.ClassVar[tuple[BinaryMetadata, ...] | None] = None
     _FIELD_PACKERS: tp.ClassVar[tuple[tp.Callable, ...] | None] = None
     _FIELD_UNPACKERS: tp.ClassVar[tuple[tp.Callable, ...] | None] = None
+    # Full unpacking fmt (see `get_full_fmt()`) and whether any field can be skipped, which requires field-by-field
+    # unpacking. Neither depends on data, so they are computed with the other caches rather than on every read.
+    _FULL_FMT: tp.ClassVar[str | None] = None
+    _CAREFUL_UNPACK_MODE: tp.ClassVar[bool] = False
+    _FIELDS_UNPACKER: tp.ClassVar[tp.Callable[[list[tp.Any]], tuple[dict, dict]] | None] = None
 
     # Set by `from_bytes()` class method, or can be manually set.
     # Will be auto-detected from values with `get_byte_order()` (defaulting to `LittleEndian`) if not defined, e.g.
@@ -1009,6 +1095,14 @@ class BinaryStruct:
     byte_order: None | ByteOrder = dataclasses.field(init=False, repr=False, default=None)
     long_varints: None | bool = dataclasses.field(init=False, repr=False, default=None)
 
+    def __init_subclass__(cls, **kwargs):
+        """Every subclass builds its own caches, even if its parent class has already been initialized."""
+        # NOTE: Zero-argument `super()` cannot be used, as `dataclass(slots=True)` replaces the class.
+        super(BinaryStruct, cls).__init_subclass__(**kwargs)
+        cls._STRUCT_INITIALIZED = False
+        cls._FIELDS = None
+        cls._FIELD_TYPES = None
+
     def __post_init__(self):
         if not self._STRUCT_INITIALIZED:
             self._initialize_struct_cls()
@@ -1054,11 +1148,11 @@ class BinaryStruct:
 
                 # `Vector` types can be specified without needing any field metadata.
                 if field_type == Vector2:
-                    metadata = BinaryArrayMetadata(2, "2f", unpack_func=Vector2)
+                    metadata = BinaryArrayMetadata(2, "2f", unpack_func=Vector2, pack_func=_vector_to_floats)
                 elif field_type == Vector3:
-                    metadata = BinaryArrayMetadata(3, "3f", unpack_func=Vector3)
+                    metadata = BinaryArrayMetadata(3, "3f", unpack_func=Vector3, pack_func=_vector_to_floats)
                 elif field_type == Vector4:
-                    metadata = BinaryArrayMetadata(4, "4f", unpack_func=Vector4)
+                    metadata = BinaryArrayMetadata(4, "4f", unpack_func=Vector4, pack_func=_vector_to_floats)
                 elif issubclass(field_type, BinaryStruct):
                     # Sub-struct.
                     metadata = BinaryMetadata(
@@ -1135,6 +1229,32 @@ class BinaryStruct:
         cls._FIELD_UNPACKERS = tuple(all_unpackers)
         cls._FIELD_PACKERS = tuple(all_packers)
         cls._STRUCT_INITIALIZED = True
+        cls._FULL_FMT = cls.get_full_fmt()
+        cls._CAREFUL_UNPACK_MODE = any(metadata.should_skip_func is not None for metadata in all_metadata)
+        # Always assigned, so that a subclass never falls back to an unpacker inherited from its parent's fields.
+        cls._FIELDS_UNPACKER = (
+            cls._get_fields_unpacker()
+            if not cls._CAREFUL_UNPACK_MODE and all(metadata.bit_count == -1 for metadata in all_metadata)
+            else None
+        )
+
+    @classmethod
+    def _get_fields_unpacker(cls) -> tp.Callable[[list[tp.Any]], tuple[dict[str, tp.Any], dict[str, tp.Any]]]:
+        """Build a function that calls every field unpacker in order on reversed `struct.unpack()` output and returns
+        `(init_values, non_init_values)` dictionaries.
+
+        Only used for structs with no bit fields or skippable fields, whose field sequence never changes. Like the field
+        unpackers themselves, this is built once with `exec()` so that `from_bytes()` does not have to loop over fields
+        and check their metadata for every instance.
+        """
+        func = "def unpack_fields(struct_output: list[tp.Any], unpackers=cls._FIELD_UNPACKERS):\n"
+        for i in range(len(cls._FIELDS)):
+            func += f"    v{i} = unpackers[{i}](struct_output)\n"
+        init_items = ", ".join(f"{field.name!r}: v{i}" for i, field in enumerate(cls._FIELDS) if field.init)
+        non_init_items = ", ".join(f"{field.name!r}: v{i}" for i, field in enumerate(cls._FIELDS) if not field.init)
+        func += f"    return {{{init_items}}}, {{{non_init_items}}}\n"
+        exec(func)
+        return locals()["unpack_fields"]
 
     @classmethod
     def from_bytes(
@@ -1176,18 +1296,23 @@ class BinaryStruct:
         field_values = {}  # type: dict[str, tp.Any]  # maps field names to final values
         bit_reader = BitFieldReader()
 
-        full_fmt = cls.get_full_fmt()
-        careful_unpack_mode = any(metadata.should_skip_func is not None for metadata in cls._FIELD_METADATA)
-
-        if not careful_unpack_mode:
+        if not cls._CAREFUL_UNPACK_MODE:
             try:
-                struct_output = list(reversed(reader.unpack(full_fmt)))
+                struct_output = list(reversed(reader.unpack(cls._FULL_FMT)))
             except Exception as ex:
-                _LOGGER.error(f"Could not unpack struct fmt for `{cls_name}`: {full_fmt}. Error: {ex}")
+                _LOGGER.error(f"Could not unpack struct fmt for `{cls_name}`: {cls._FULL_FMT}. Error: {ex}")
                 raise
         else:
             struct_output = None
 
+        if cls._FIELDS_UNPACKER is not None:
+            try:
+                init_values, non_init_values = cls._FIELDS_UNPACKER(struct_output)
+            except Exception as ex:
+                _LOGGER.error(f"Error occurred while trying to unpack fields of `{cls_name}`: {ex}")
+                raise
+            return cls._init_from_unpacked(init_values, non_init_values, byte_order, long_varints)
+
         for field, field_type, field_metadata, field_unpacker in zip(
             cls._FIELDS, cls._FIELD_TYPES, cls._FIELD_METADATA, cls._FIELD_UNPACKERS
         ):
@@ -1242,6 +1367,16 @@ class BinaryStruct:
             else:
                 init_values[field.name] = field_value
 
+        return cls._init_from_unpacked(init_values, non_init_values, byte_order, long_varints)
+
+    @classmethod
+    def _init_from_unpacked(
+        cls,
+        init_values: dict[str, tp.Any],
+        non_init_values: dict[str, tp.Any],
+        byte_order: ByteOrder,
+        long_varints: bool | None,
+    ) -> Self:
         # noinspection PyArgumentList
         instance = cls(**init_values)
         instance.byte_order = byte_order
@@ -1456,15 +1591,14 @@ class BinaryStruct:
             self._FIELDS, self._FIELD_TYPES, self._FIELD_METADATA, self._FIELD_PACKERS, field_values.values()
         ):
 
-            if field.metadata.get("NOT_BINARY", False):
-                continue  # field excluded
+            # NOTE: `NOT_BINARY` fields are already excluded from `_FIELDS`.
 
             if field_metadata.should_skip_func is not None:
                 if field_metadata.should_skip_func(long_varints, field_values):
                     # Write nothing for this field.
                     continue
 
-            if not bit_writer.empty and field_metadata.bit_count == -1:
+            if field_metadata.bit_count == -1 and not bit_writer.empty:
                 # Pad out bit writer.
                 full_fmt += bit_writer.finish_field_buffer(struct_input)
 
@@ -1486,9 +1620,8 @@ class BinaryStruct:
                     reserve_offset = start_offset + get_fmt_size()
                     reserve_fmt = byte_order.value + field_metadata.fmt
                     writer.mark_reserved_offset(field.name, reserve_fmt, reserve_offset, obj=reserve_obj)
-                    null_size = writer.calcsize(reserve_fmt)
-                    struct_input.append(b"\0" * null_size)
-                    full_fmt += f"{null_size}s"
+                    # Null pad bytes take no struct input, so no placeholder `bytes` need to be allocated.
+                    full_fmt += f"{writer.calcsize(reserve_fmt)}x"
                     continue
                 else:
                     # Use lone asserted value.
@@ -3,7 +3,6 @@ from __future__ import annotations
 __all__ = ["BaseVector", "Vector2", "Vector3", "Vector4"]
 
 import abc
-import ast
 import math
 import re
 import typing as tp
@@ -22,6 +21,18 @@ if tp.TYPE_CHECKING:
     from .matrix import Matrix3, Matrix4
 
 
+def _parse_float_tuple(tuple_string: str) -> list[float]:
+    """Parse a tuple of numbers like "(1.0, -2.5, 3)" (already validated by a `from_repr` pattern).
+
+    Much faster than `ast.literal_eval()`, which matters when decoding every vector in a large JSON file. Raises a
+    `ValueError` for empty elements like "(1.0,, 2.0)", though a single trailing comma is allowed.
+    """
+    elements = tuple_string[1:-1].split(",")
+    if not elements[-1].strip():
+        elements.pop()  # trailing comma
+    return [float(element) for element in elements]
+
+
 @dataclass(slots=True)
 class BaseVector(abc.ABC):
     """Simple numpy row vector wrapper."""
@@ -161,7 +172,7 @@ class Vector2(BaseVector):
     def from_repr(cls, repr_string: str) -> Vector2:
         """For JSON decoding."""
         if (match := re.match(r"^Vector2(\([\d .,]+\))", repr_string)) is not None:
-            return cls(ast.literal_eval(match.group(1)))
+            return cls(_parse_float_tuple(match.group(1)))
         raise ValueError(f"Cannot read `Vector2` string: {repr_string}")
 
 
@@ -186,7 +197,7 @@ class Vector3(BaseVector):
     def from_repr(cls, repr_string: str) -> Vector3:
         """For JSON decoding."""
         if (match := re.match(r"^Vector3(\([-\d., ]+\))", repr_string)) is not None:
-            return cls(ast.literal_eval(match.group(1)))
+            return cls(_parse_float_tuple(match.group(1)))
         raise ValueError(f"Cannot read `Vector3` string: {repr_string}")
 
     def cross(self, other_vector: Vector3) -> Vector3:
@@ -279,7 +290,7 @@ class Vector4(BaseVector):
     def from_repr(cls, repr_string: str) -> Vector4:
         """For JSON decoding."""
         if (match := re.match(r"^Vector4(\([\d .,]+\))", repr_string)) is not None:
-            return cls(ast.literal_eval(match.group(1)))
+            return cls(_parse_float_tuple(match.group(1)))
         raise ValueError(f"Cannot read `Vector4` string: {repr_string}")
 
     def multiply_by_matrix(self, matrix4: Matrix4) -> Vector4:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = ["PY_NAME_RE", "word_wrap", "camel_case_to_spaces", "string_to_identifier", "pad_chars", "indent_lines"]
 
+import functools
 import re
 import textwrap
 
@@ -54,8 +55,12 @@ def string_to_identifier(spaces_string: str, remove_prefixes=(), preserve_models
     return id_string
 
 
+@functools.lru_cache(maxsize=4096)
 def pad_chars(text, encoding=None, null_terminate=True, alignment=4, pad: str | bytes = None) -> str | bytes:
-    """Pad text out to given multiple of byte length with null bytes. Optionally, encode it first."""
+    """Pad text out to given multiple of byte length with null bytes. Optionally, encode it first.
+
+    Results are cached, as the same entry names are encoded (e.g. as Shift-JIS) every time a file is written.
+    """
     if alignment < 0 or not isinstance(alignment, int):
         raise ValueError("pad must be an integer greater than zero.")
     if encoding is not None:
@@ -64,6 +69,8 @@ def pad_chars(text, encoding=None, null_terminate=True, alignment=4, pad: str |
         encoded = text + ("\0" if null_terminate else "")
     if pad is None:
         pad = b"\0" if encoding is not None else "\0"
+    if len(pad) == 1:
+        return encoded + pad * (-len(encoded) % alignment)
     while len(encoded) % alignment != 0:
         encoded += pad
     return encoded
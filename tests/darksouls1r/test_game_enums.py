@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from soulstruct.darksouls1r.game_types import *
+from soulstruct.darksouls1r.game_types.game_enums_manager import GameEnumsManager
+
+M10_00_ENUMS = '''
+from soulstruct.darksouls1r.game_types import *
+
+
+class Characters(Character):
+    Knight = 1000100
+    Shared = 1000300
+
+
+class Flags(Flag):
+    Opened = 11000100
+'''
+
+M10_01_ENUMS = '''
+from soulstruct.darksouls1r.game_types import *
+
+
+class Characters(Character):
+    Dragon = 1010100
+    Shared = 1000300
+'''
+
+
+class GameEnumsManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        module_paths = []
+        for module_name, source in (("m10_00_00_00_enums", M10_00_ENUMS), ("m10_01_00_00_enums", M10_01_ENUMS)):
+            module_path = Path(self.temp_dir.name, f"{module_name}.py")
+            module_path.write_text(source)
+            module_paths.append(module_path)
+        self.manager = GameEnumsManager(module_paths)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_check_out_star_module(self):
+        enum_info = self.manager.check_out_enum(1000100, Character, star_module_names=["m10_00_00_00_enums"])
+        self.assertEqual(enum_info.module_name, "m10_00_00_00_enums")
+        self.assertEqual(enum_info.get_variable_string(["m10_00_00_00_enums"]), "Characters.Knight")
+
+    def test_check_out_non_star_module(self):
+        enum_info = self.manager.check_out_enum(1010100, Character, star_module_names=["m10_00_00_00_enums"])
+        self.assertEqual(enum_info.module_name, "m10_01_00_00_enums")
+        self.assertEqual(enum_info.get_variable_string(["m10_00_00_00_enums"]), "m10_01_Characters.Dragon")
+        self.assertIn(enum_info, self.manager.used_enums)
+
+    def test_ambiguous_and_missing_values(self):
+        with self.assertRaises(GameEnumsManager.AmbiguousEnumValueError):
+            self.manager.check_out_enum(1000300, Character)
+        # Star module hit takes precedence over other modules.
+        enum_info = self.manager.check_out_enum(1000300, Character, star_module_names=["m10_01_00_00_enums"])
+        self.assertEqual(enum_info.module_name, "m10_01_00_00_enums")
+        with self.assertRaises(GameEnumsManager.MissingEnumValueError):
+            self.manager.check_out_enum(1234567, Character)
+        with self.assertRaises(GameEnumsManager.MissingEnumTypeError):
+            self.manager.check_out_enum(1234567, ItemLotParam)
+        # `Flag` is only found in a non-star module, so its missing value is still a missing value.
+        with self.assertRaises(GameEnumsManager.MissingEnumValueError):
+            self.manager.check_out_enum(11000999, Flag, star_module_names=["m10_01_00_00_enums"])
+
+    def test_reverse_lookups(self):
+        self.manager.check_out_enum(1010100, Character)
+        self.assertEqual(
+            self.manager._value_module_names[1000300], ["m10_00_00_00_enums", "m10_01_00_00_enums"]
+        )
+        self.assertEqual(self.manager._value_module_names[11000100], ["m10_00_00_00_enums"])
+        self.assertEqual(self.manager._game_type_module_names[Flag], {"m10_00_00_00_enums"})
+
+        # Reloading modules invalidates the lookups, which are rebuilt on the next check-out.
+        self.manager.refresh_enums()
+        self.assertIsNone(self.manager._value_module_names)
+        self.assertEqual(self.manager.check_out_enum(11000100, Flag).module_name, "m10_00_00_00_enums")
+        self.assertIsNotNone(self.manager._value_module_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
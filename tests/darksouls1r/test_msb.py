@@ -3,6 +3,7 @@ import shutil
 import unittest
 from pathlib import Path
 
+from soulstruct.base.maps.msb.utils import GroupBitSet128, GroupBitSet1024
 from soulstruct.darksouls1r.maps import MSB, MapStudioDirectory
 from soulstruct.utilities.maths import Vector3
 from soulstruct.utilities.inspection import profile_function, Timer
@@ -98,5 +99,24 @@ class MSBTest(unittest.TestCase):
                 os.remove(str(test_file))
 
 
+class GroupBitSetTest(unittest.TestCase):
+
+    def test_from_repr(self):
+        self.assertEqual(GroupBitSet128.from_repr("GroupBitSet128()").enabled_bits, set())
+        self.assertEqual(GroupBitSet128.from_repr("GroupBitSet128(5)").enabled_bits, {5})  # no comma in JSON
+        self.assertEqual(GroupBitSet128.from_repr("GroupBitSet128(5,)").enabled_bits, {5})
+        self.assertEqual(GroupBitSet128.from_repr("GroupBitSet128(0, 31, 127)").enabled_bits, {0, 31, 127})
+        bit_set = GroupBitSet1024({0, 500, 1023})
+        self.assertEqual(GroupBitSet1024.from_repr(repr(bit_set)).enabled_bits, bit_set.enabled_bits)
+
+    def test_from_repr_invalid(self):
+        for repr_string in (
+            "GroupBitSet128(1,, 2)", "GroupBitSet128(,)", "GroupBitSet128(, 1)", "GroupBitSet128(1 2)",
+            "GroupBitSet256(1, 2)", "GroupBitSet128(-1)",
+        ):
+            with self.subTest(repr_string=repr_string), self.assertRaises(ValueError):
+                GroupBitSet128.from_repr(repr_string)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,11 @@
+import pickle
 import unittest
 
-from soulstruct.containers.tpf import TPF
+from soulstruct.base.textures.dds import DXGI_FORMAT
+from soulstruct.containers.tpf import *
+from soulstruct.dcx import DCXType, compress
+from soulstruct.containers.tpf import TPFStruct
+from soulstruct.utilities.binary import BinaryReader
 
 
 class TPFTest(unittest.TestCase):
@@ -14,5 +19,63 @@ class TPFTest(unittest.TestCase):
             f.write(tpf.textures[0].data)
 
 
+class TPFTextureTest(unittest.TestCase):
+    """Packs and unpacks console textures, which need no DDS header, without any game files."""
+
+    RAW_DATA = bytes(range(256)) * 4
+
+    def _get_packed_tpf(self, textures: list[TPFTexture]) -> bytes:
+        return bytes(TPF(textures=textures, platform=TPFPlatform.PS4, encoding_type=2).to_writer())
+
+    def _unpack_textures(self, tpf_data: bytes, count: int) -> list[TPFTexture]:
+        reader = BinaryReader(tpf_data)
+        reader.seek(TPFStruct.get_size())
+        return [TPFTexture.from_tpf_reader(reader, TPFPlatform.PS4, 0, "shift_jis_2004") for _ in range(count)]
+
+    def _get_texture(self, name: str, texture_flags: int) -> TPFTexture:
+        header = TextureHeader(64, 32, texture_count=1, unk2=0xD, dxgi_format=DXGI_FORMAT(71))
+        return TPFTexture(name=name, format=1, texture_flags=texture_flags, data=self.RAW_DATA, header=header)
+
+    def test_unpacked_data_view(self):
+        tpf_data = self._get_packed_tpf([self._get_texture("raw", 0)])
+        texture = self._unpack_textures(tpf_data, 1)[0]
+        self.assertEqual(texture.name, "raw")
+        self.assertIsInstance(texture.data, memoryview)
+        self.assertEqual(texture.data, self.RAW_DATA)
+        self.assertEqual(self._get_packed_tpf([texture]), tpf_data)
+        unpickled = pickle.loads(pickle.dumps(texture))
+        self.assertIsInstance(unpickled.data, bytes)
+        self.assertEqual(unpickled.data, self.RAW_DATA)
+
+    def test_lazy_dcx_data(self):
+        tpf_data = self._get_packed_tpf([self._get_texture("dcx", 2)])
+        texture = self._unpack_textures(tpf_data, 1)[0]
+        self.assertIsNotNone(texture._dcx_data)  # not decompressed yet
+        self.assertEqual(texture.data, self.RAW_DATA)
+        self.assertIsNone(texture._dcx_data)
+
+        # Replacing data before it is ever decompressed must not pack the stale compressed data.
+        texture = self._unpack_textures(tpf_data, 1)[0]
+        new_data = bytes(reversed(self.RAW_DATA))
+        texture.data = new_data
+        repacked = self._unpack_textures(self._get_packed_tpf([texture]), 1)[0]
+        self.assertEqual(repacked.data, new_data)
+
+
+    def test_unchanged_dcx_round_trip(self):
+        dcx_data = compress(self.RAW_DATA, DCXType.DS1_DS2)
+        texture = self._get_texture("dcx", 2)
+        del texture.data  # as loaded by `from_tpf_reader()`
+        texture._dcx_data = dcx_data
+        tpf_data = self._get_packed_tpf([texture])
+
+        loaded = self._unpack_textures(tpf_data, 1)[0]
+        self.assertEqual(loaded.get_unchanged_dcx_data(), dcx_data)
+        self.assertEqual(self._get_packed_tpf([loaded]), tpf_data)
+
+        loaded.texture_flags = 0  # no longer compressed
+        self.assertIsNone(loaded.get_unchanged_dcx_data())
+
+
 if __name__ == '__main__':
     unittest.main()
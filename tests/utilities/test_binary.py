@@ -0,0 +1,128 @@
+import dataclasses
+import io
+import struct
+import unittest
+
+from soulstruct.utilities.binary import *
+
+
+@dataclasses.dataclass(slots=True)
+class ParentStruct(BinaryStruct):
+    a: int
+
+
+@dataclasses.dataclass(slots=True)
+class ChildStruct(ParentStruct):
+    b: int = dataclasses.field(**Binary("B", bit_count=4))
+    c: int = dataclasses.field(**Binary("B", bit_count=4))
+
+
+@dataclasses.dataclass(slots=True)
+class OtherParentStruct(BinaryStruct):
+    a: int
+
+
+@dataclasses.dataclass(slots=True)
+class OtherChildStruct(OtherParentStruct):
+    b: int = dataclasses.field(**Binary("B", bit_count=4))
+    c: int = dataclasses.field(**Binary("B", bit_count=4))
+
+
+@dataclasses.dataclass(slots=True)
+class OffsetStruct(BinaryStruct):
+    _magic: bytes = dataclasses.field(init=False, **BinaryString(4, asserted=b"TEST"))
+    count: int
+    data_offset: uint
+    scale: float
+    _pad: bytes = dataclasses.field(init=False, **BinaryPad(4))
+
+
+class BinaryReaderTest(unittest.TestCase):
+
+    DATA = struct.pack("<4sIhf", b"TEST", 7, -2, 1.5) + b"abc\0" + "ab".encode("utf-16-le") + b"\0\0" + b"\xFF"
+
+    def _get_readers(self) -> tuple[BinaryReader, BinaryReader]:
+        """Reader using the `source_bytes` fast path and reader using the underlying buffer only."""
+        fast_reader = BinaryReader(self.DATA)
+        buffer_reader = BinaryReader(io.BytesIO(self.DATA))
+        self.assertIsNotNone(fast_reader.source_bytes)
+        self.assertIsNone(buffer_reader.source_bytes)
+        return fast_reader, buffer_reader
+
+    def test_unpack(self):
+        for reader in self._get_readers():
+            self.assertEqual(reader.unpack("4sI"), (b"TEST", 7))
+            self.assertEqual(reader.position, 8)
+            self.assertEqual(reader.unpack("f", offset=10), (1.5,))
+            self.assertEqual(reader.position, 8)  # restored
+            self.assertEqual(reader.unpack_value("h"), -2)
+            self.assertEqual(reader.position, 10)
+            with self.assertRaises(Exception):
+                reader.unpack("8s", offset=len(self.DATA) - 4)
+
+    def test_unpack_null_terminated(self):
+        for reader in self._get_readers():
+            self.assertEqual(reader.unpack_bytes(offset=14), b"abc")
+            self.assertEqual(reader.position, 0)  # old offset restored
+            reader.seek(14)
+            self.assertEqual(reader.unpack_bytes(), b"abc")
+            self.assertEqual(reader.position, 18)  # after null terminator
+            self.assertEqual(reader.unpack_string(encoding="utf-16-le", reset_old_offset=False), "ab")
+            self.assertEqual(reader.position, 24)
+            self.assertEqual(reader.unpack_string(offset=14), "abc")
+            self.assertEqual(reader.position, 24)
+            with self.assertRaises(ValueError):
+                reader.unpack_bytes(offset=len(self.DATA) - 1)
+
+    def test_unpack_null_terminated_utf16_alignment(self):
+        """UTF-16 terminator must be two aligned null bytes, not the high byte of one char and low byte of the next."""
+        data = "Āa".encode("utf-16-le") + b"\0\0"  # b"\x00\x01a\x00\x00\x00"
+        for reader in (BinaryReader(data), BinaryReader(io.BytesIO(data))):
+            self.assertEqual(reader.unpack_string(offset=0, encoding="utf-16-le"), "Āa")
+
+
+class BinaryStructTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        data = struct.pack("<4siIf4x", b"TEST", -5, 100, 0.25)
+        instance = OffsetStruct.from_bytes(data)
+        self.assertIsNotNone(OffsetStruct._FIELDS_UNPACKER)
+        self.assertEqual((instance.count, instance.data_offset, instance.scale), (-5, 100, 0.25))
+        self.assertEqual(bytes(instance), data)
+        with self.assertRaises(BinaryFieldValueError):
+            OffsetStruct.from_bytes(b"NOPE" + data[4:])
+
+    def test_reserved_field_padding(self):
+        """Reserved (`None`) fields are packed as null padding and can be filled later."""
+        instance = OffsetStruct(count=3, data_offset=RESERVED, scale=2.0)
+        instance.byte_order = ByteOrder.LittleEndian
+        writer = instance.to_writer()
+        self.assertEqual(writer.position, OffsetStruct.get_size())
+        with self.assertRaises(ValueError):
+            bytes(writer)  # not filled yet
+        writer.fill("data_offset", 0x1234, obj=instance)
+        self.assertEqual(bytes(writer), struct.pack("<4siIf4x", b"TEST", 3, 0x1234, 2.0))
+
+    def test_subclass_child_first(self):
+        """Subclass that adds bit fields must not reuse its parent's fields unpacker."""
+        data = struct.pack("<iB", 10, 0b0010_0001)
+        ChildStruct.from_bytes(data)
+        parent = ParentStruct.from_bytes(data)
+        self.assertIsNone(ChildStruct._FIELDS_UNPACKER)
+        self.assertIsNotNone(ParentStruct._FIELDS_UNPACKER)
+        self.assertEqual(parent.a, 10)
+        child = ChildStruct.from_bytes(data)
+        self.assertEqual((child.a, child.b, child.c), (10, 1, 2))
+        self.assertEqual(bytes(child), data)
+
+    def test_subclass_parent_first(self):
+        """Subclass must initialize its own caches even if its parent has already been initialized."""
+        data = struct.pack("<iB", 10, 0b0010_0001)
+        self.assertEqual(OtherParentStruct.from_bytes(data).a, 10)
+        child = OtherChildStruct.from_bytes(data)
+        self.assertEqual((child.a, child.b, child.c), (10, 1, 2))
+        self.assertEqual(bytes(child), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
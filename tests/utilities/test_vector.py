@@ -0,0 +1,21 @@
+import unittest
+
+from soulstruct.utilities.maths import Vector2, Vector3, Vector4
+
+
+class VectorTest(unittest.TestCase):
+
+    def test_from_repr(self):
+        self.assertEqual(list(Vector2.from_repr("Vector2(1, 2.5)")), [1.0, 2.5])
+        self.assertEqual(list(Vector3.from_repr("Vector3(1.0, -2.5, 3)")), [1.0, -2.5, 3.0])
+        self.assertEqual(list(Vector3.from_repr("Vector3(1.0, -2.5, 3,)")), [1.0, -2.5, 3.0])  # trailing comma
+        self.assertEqual(list(Vector4.from_repr("Vector4(0, 0, 0, 1)")), [0.0, 0.0, 0.0, 1.0])
+
+    def test_from_repr_invalid(self):
+        for repr_string in ("Vector3(1.0,, 2.0, 3.0)", "Vector3(, 1.0, 2.0)", "Vector3(a, b, c)", "Vector2()"):
+            with self.subTest(repr_string=repr_string), self.assertRaises(ValueError):
+                Vector3.from_repr(repr_string)
+
+
+if __name__ == '__main__':
+    unittest.main()